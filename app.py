@@ -1,10 +1,21 @@
+import asyncio
+import mmap
 import os
+import queue
+import re
+import shutil
 import sqlite3
+import time
+import uuid
+from contextlib import asynccontextmanager, contextmanager
 from functools import wraps
 from datetime import datetime
 
-from flask import (
-    Flask,
+from quart import (
+    Quart,
+    Response,
+    abort,
+    g,
     render_template,
     request,
     redirect,
@@ -12,19 +23,44 @@ from flask import (
     flash,
     session,
 )
-from werkzeug.utils import secure_filename
-from werkzeug.security import generate_password_hash, check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerifyMismatchError
+from werkzeug.security import check_password_hash
 
 # ---------------------------------------------------------------------
 # App setup
 # ---------------------------------------------------------------------
-app = Flask(__name__)
+app = Quart(__name__)
 
 BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 
 # Secret key for sessions
 app.secret_key = os.environ.get("SECRET_KEY", "dev-secret-key-change-me")
 
+# Quart caps request bodies at 16 MB by default; CCTV clips run to GBs.
+app.config["MAX_CONTENT_LENGTH"] = 8 * 1024 * 1024 * 1024
+
+# Chunk size for streaming uploads to disk
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Content-Range header for chunked uploads, e.g. "bytes 0-8388607/73400320"
+CONTENT_RANGE_RE = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
+
+# Largest single chunk a client may post. Chunk bodies are buffered in
+# RAM before being patched into the file, so this — not the 8 GB
+# MAX_CONTENT_LENGTH — bounds per-request memory. The uploader sends
+# 8 MB chunks; 64 MB leaves headroom for other clients.
+MAX_CHUNK_SIZE = 64 * 1024 * 1024
+
+# In-flight chunked uploads, keyed by server-issued upload id:
+# {"total": int, "ranges": [(start, end)], "stored_name": str,
+#  "display": str, "touched": float}
+# Single-process state; a shared store would be needed for multiple workers.
+# Uploads idle past the TTL are swept and their preallocated partial
+# files unlinked, so an abandoned multi-GB upload doesn't pin disk space.
+_chunk_uploads = {}
+CHUNK_UPLOAD_TTL = 3600
+
 # Upload directories
 UPLOAD_ROOT = os.path.join(BASE_DIR, "static", "uploads")
 IMAGE_UPLOAD_DIR = os.path.join(UPLOAD_ROOT, "images")
@@ -33,29 +69,149 @@ VIDEO_UPLOAD_DIR = os.path.join(UPLOAD_ROOT, "videos")
 os.makedirs(IMAGE_UPLOAD_DIR, exist_ok=True)
 os.makedirs(VIDEO_UPLOAD_DIR, exist_ok=True)
 
-ALLOWED_IMAGE_EXTENSIONS = {"jpg", "jpeg", "png"}
-ALLOWED_VIDEO_EXTENSIONS = {"mp4", "avi", "mov", "mkv"}
+ALLOWED_IMAGE_EXTENSIONS = frozenset({"jpg", "jpeg", "png"})
+ALLOWED_VIDEO_EXTENSIONS = frozenset({"mp4", "avi", "mov", "mkv"})
+
+# Whole-filename validation (name charset, length cap and extension) in
+# one precompiled pass, built from the extension sets above so the
+# whitelist has a single source of truth. Plain stdlib re; swap in
+# google-re2 (same API) if upload throughput ever makes backtracking a
+# concern.
+IMAGE_NAME_RE = re.compile(
+    r"(?i)[\w.\- ]{1,255}\.(" + "|".join(ALLOWED_IMAGE_EXTENSIONS) + r")"
+)
+VIDEO_NAME_RE = re.compile(
+    r"(?i)[\w.\- ]{1,255}\.(" + "|".join(ALLOWED_VIDEO_EXTENSIONS) + r")"
+)
 
 # SQLite database for users & cases
 DATABASE = os.path.join(BASE_DIR, "users.db")
 
+# Simulated match timeline shown until the recognition backend lands
+DUMMY_VIDEO_MATCHES = [
+    {"time": "00:05", "label": "Person_A", "score": 0.27},
+    {"time": "00:23", "label": "Person_B", "score": 0.35},
+    {"time": "01:02", "label": "Unknown", "score": 0.62},
+]
+
 
 # ---------------------------------------------------------------------
 # DB helpers
 # ---------------------------------------------------------------------
-def get_db():
-    conn = sqlite3.connect(DATABASE)
+DB_POOL_SIZE = 8
+
+# Hot-path query, kept as one module-level string so every execution
+# hits the per-connection prepared-statement cache (sqlite3 keys the
+# cache on the exact SQL text). Explicit columns also skip marshaling
+# fields login never reads.
+LOGIN_USER_SQL = (
+    "SELECT id, username, password_hash, is_suspended FROM users WHERE username = ?"
+)
+
+
+def _make_connection():
+    """
+    Open a connection with the pragmas every pooled connection needs:
+    WAL so readers don't block the writer, a short busy_timeout so a
+    contended lock fails fast into execute_with_retry's async backoff
+    instead of spinning inside sqlite, and a bigger page cache.
+    The login statement is parsed once here so the first real login on
+    each connection reuses the cached plan.
+    """
+    conn = sqlite3.connect(DATABASE, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA cache_size=-20000")
+    try:
+        conn.execute(LOGIN_USER_SQL, ("",)).fetchone()
+    except sqlite3.OperationalError:
+        pass  # first boot: init_db hasn't created the tables yet
     return conn
 
 
+_db_pool = queue.Queue(maxsize=DB_POOL_SIZE)
+
+
+@asynccontextmanager
+async def get_db():
+    """
+    Borrow a pooled connection for the duration of an async-with block.
+    Connections are opened once at startup, so handlers skip the
+    per-request sqlite3_open and schema-cache warm-up entirely. The
+    acquire runs in a thread so an exhausted pool never blocks the
+    event loop, and waiting out the timeout becomes a 503 instead of an
+    unhandled queue.Empty.
+    """
+    try:
+        conn = await asyncio.to_thread(_db_pool.get, True, 10)
+    except queue.Empty:
+        abort(503)
+    try:
+        yield conn
+    finally:
+        _db_pool.put(conn)
+
+
+async def execute_with_retry(conn, sql, params=(), attempts=3):
+    """
+    Run a write statement, retrying briefly if another connection holds
+    the write lock longer than busy_timeout allows. The statement runs
+    in a thread and the backoff uses asyncio.sleep, so a contended lock
+    stalls only this request instead of the whole event loop.
+    """
+    for attempt in range(attempts):
+        try:
+            return await asyncio.to_thread(conn.execute, sql, params)
+        except sqlite3.OperationalError as exc:
+            if "locked" not in str(exc) or attempt == attempts - 1:
+                raise
+            await asyncio.sleep(0.05 * (attempt + 1))
+
+
+# Short-TTL cache of user rows so login_required doesn't hit SQLite on
+# every authenticated request: user_id -> (expires_at, row dict or None).
+# Single-process state, same caveat as _chunk_uploads for multi-worker.
+USER_CACHE_TTL = 300
+_user_cache = {}
+
+
+async def get_user(user_id):
+    """
+    Fetch a user row by id, served from the TTL cache when fresh and
+    falling back to SQLite (re-priming the cache) otherwise.
+    """
+    entry = _user_cache.get(user_id)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+
+    async with get_db() as conn:
+        row = conn.execute(
+            "SELECT id, username, is_suspended FROM users WHERE id = ?",
+            (user_id,),
+        ).fetchone()
+
+    user = dict(row) if row else None
+    _user_cache[user_id] = (time.monotonic() + USER_CACHE_TTL, user)
+    return user
+
+
+def invalidate_user_cache(user_id):
+    """
+    Drop a cached user row after an admin edit/suspend/delete so the
+    change is visible immediately instead of after the TTL.
+    """
+    _user_cache.pop(user_id, None)
+
+
 def init_db():
     """
     Create required tables if they don't exist:
         users  - user accounts + suspension flag
         cases  - case management (title, description, status, created_by, timestamps)
     """
-    conn = get_db()
+    conn = _make_connection()
 
     # Users table
     conn.execute(
@@ -85,30 +241,194 @@ def init_db():
         """
     )
 
+    # Explicit on top of the UNIQUE constraint so the index is visible
+    # in the schema, then ANALYZE so the planner has fresh stats for it.
+    conn.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_users_username ON users(username)"
+    )
+    conn.execute("ANALYZE")
+
     conn.commit()
     conn.close()
 
 
-# Run table creation on startup
+# Run table creation on startup, then fill the pool (pooled connections
+# warm the login statement cache, which needs the tables to exist).
 init_db()
+for _ in range(DB_POOL_SIZE):
+    _db_pool.put(_make_connection())
+
+
+# ---------------------------------------------------------------------
+# Password hashing
+# ---------------------------------------------------------------------
+# Argon2id tuned for interactive logins: lower single-thread latency than
+# werkzeug's 600k-iteration PBKDF2 default at comparable security.
+password_hasher = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=1)
+
+
+def hash_password(password: str) -> str:
+    return password_hasher.hash(password)
+
+
+def verify_password(stored_hash: str, password: str):
+    """
+    Check a password against its stored hash.
+    Returns (ok, needs_rehash); legacy werkzeug PBKDF2 hashes from
+    before the Argon2 switch still verify and report needs_rehash so
+    login can migrate them in place.
+    """
+    try:
+        password_hasher.verify(stored_hash, password)
+        return True, password_hasher.check_needs_rehash(stored_hash)
+    except VerifyMismatchError:
+        return False, False
+    except InvalidHashError:
+        if check_password_hash(stored_hash, password):
+            return True, True
+        return False, False
 
 
 # ---------------------------------------------------------------------
 # Utility helpers & decorators
 # ---------------------------------------------------------------------
-def allowed_file(filename: str, allowed_exts) -> bool:
-    return "." in filename and filename.rsplit(".", 1)[1].lower() in allowed_exts
+def allowed_file(filename: str, pattern: re.Pattern) -> bool:
+    return pattern.fullmatch(filename) is not None
+
+
+def build_upload_name(original: str) -> str:
+    """
+    Machine-generated name for a stored upload: uuid4 hex plus the
+    (already validated) extension. Skips secure_filename's regex and
+    unicode normalization, can't collide, and removes the traversal
+    surface since the client never controls the stored name.
+    """
+    ext = original.rsplit(".", 1)[-1].lower()
+    return f"{uuid.uuid4().hex}.{ext}"
+
+
+def _open_preallocated(path, size):
+    """
+    Open a fresh upload target, reserving the full extent up front when
+    the size is known: one contiguous allocation instead of extent-tree
+    and metadata-journal updates on every chunk write.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    if size and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except OSError:
+            pass  # filesystem without fallocate support; writes still work
+    return fd
+
+
+def _save_upload(file, dest_path):
+    """
+    Persist a parsed multipart upload kernel-side where possible:
+    os.sendfile copies the spooled temp file to the destination without
+    routing the bytes through Python. Small uploads whose spool never
+    rolled over to disk are copied straight from memory instead —
+    calling fileno() on an in-memory SpooledTemporaryFile would force
+    it onto disk first, adding a temp-file write for exactly the
+    uploads that avoided one. A 1 MB copyfileobj loop also covers
+    platforms without sendfile.
+    """
+    src = file.stream
+    src.seek(0)
+    dst_fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        src_fd = None
+        if hasattr(os, "sendfile") and getattr(src, "_rolled", True):
+            try:
+                src_fd = src.fileno()
+            except (AttributeError, OSError, ValueError):
+                src_fd = None
+
+        if src_fd is not None:
+            offset = 0
+            while True:
+                sent = os.sendfile(dst_fd, src_fd, offset, STREAM_CHUNK_SIZE)
+                if sent == 0:
+                    break
+                offset += sent
+        else:
+            with os.fdopen(dst_fd, "wb", closefd=False) as dst:
+                shutil.copyfileobj(src, dst, STREAM_CHUNK_SIZE)
+    finally:
+        os.close(dst_fd)
+
+
+@contextmanager
+def mmap_readonly(path):
+    """
+    Page-cache-backed read-only view of a saved upload. The recognition
+    backend reads straight from the mapped pages (numpy can wrap the
+    buffer via frombuffer), so no full-file bytes copy is made and
+    concurrent consumers share the same pages.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield memoryview(b"")
+            return
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mm)
+        try:
+            yield view
+        finally:
+            view.release()
+            mm.close()
+
+
+def run_recognition(query_buffer):
+    """
+    Recognition backend placeholder: takes a zero-copy buffer over the
+    query image and returns simulated matches until the real engine is
+    integrated.
+    """
+    return [
+        {"label": "Person_A", "score": 0.23, "source": "suspect_ali_1.jpg"},
+        {"label": "Person_B", "score": 0.41, "source": "suspect_maria_2.png"},
+        {"label": "Unknown", "score": 0.68, "source": "unknown_3.png"},
+    ]
+
+
+def _write_at(path, offset, data):
+    """
+    Patch bytes into an existing file at the given offset (chunked
+    uploads arrive out of order).
+    """
+    with open(path, "r+b") as f:
+        f.seek(offset)
+        f.write(data)
+
+
+@app.before_request
+async def _load_current_user():
+    """
+    Resolve the logged-in user once per request. The session cookie is
+    deserialized a single time here and the (cached) user row lands on
+    g, so decorators and handlers read g.user_id/g.username instead of
+    each walking session.get and the user cache again.
+    """
+    g.user_id = session.get("user_id")
+    g.user = await get_user(g.user_id) if g.user_id else None
+    g.username = g.user["username"] if g.user else None
 
 
 def login_required(view_func):
     """
-    Require a logged-in user.
+    Require a logged-in, non-suspended user. The user row comes off g
+    (loaded once per request from the TTL cache), so suspensions and
+    deletions take effect mid-session without SQLite on the hot path.
     """
     @wraps(view_func)
-    def wrapped_view(*args, **kwargs):
-        if not session.get("user_id"):
+    async def wrapped_view(*args, **kwargs):
+        if not g.user_id:
+            return redirect(url_for("login"))
+        if not g.user or g.user["is_suspended"]:
+            session.clear()
             return redirect(url_for("login"))
-        return view_func(*args, **kwargs)
+        return await view_func(*args, **kwargs)
     return wrapped_view
 
 
@@ -117,115 +437,162 @@ def admin_required(view_func):
     Only allow access if the logged-in user is 'admin'.
     """
     @wraps(view_func)
-    def wrapped_view(*args, **kwargs):
-        if not session.get("user_id"):
+    async def wrapped_view(*args, **kwargs):
+        if not g.user_id:
             return redirect(url_for("login"))
-        if session.get("username") != "admin":
-            flash("Admin access required to view this page.", "warning")
+        if g.username != "admin":
+            await flash("Admin access required to view this page.", "warning")
             return redirect(url_for("index"))
-        return view_func(*args, **kwargs)
+        return await view_func(*args, **kwargs)
     return wrapped_view
 
 
 def is_admin() -> bool:
-    return session.get("username") == "admin"
+    return g.username == "admin"
+
+
+# ---------------------------------------------------------------------
+# Pre-rendered pages
+# ---------------------------------------------------------------------
+# The login and register pages are identical for every anonymous
+# visitor, so Jinja runs once at startup and the GET handlers return
+# cached bytes. The dashboard can't join them: its navbar embeds the
+# logged-in username. Logged-in visitors (different navbar) and the dev
+# reloader fall back to a live render.
+_page_cache = {}
+
+
+@app.before_serving
+async def _prerender_anonymous_pages():
+    if app.debug:
+        return  # keep template editing live in dev
+    async with app.test_request_context("/"):
+        _page_cache["login.html"] = (await render_template("login.html")).encode("utf-8")
+        _page_cache["register.html"] = (await render_template("register.html")).encode("utf-8")
+
+
+def _cached_page(template_name):
+    """
+    Cached bytes for an anonymous page, or None when a live render is
+    needed (logged-in visitor, dev mode, or before first serving).
+    """
+    if g.user_id:
+        return None
+    cached = _page_cache.get(template_name)
+    if cached is None:
+        return None
+    return Response(cached, mimetype="text/html")
 
 
 # ---------------------------------------------------------------------
 # Auth routes
 # ---------------------------------------------------------------------
 @app.route("/register", methods=["GET", "POST"])
-def register():
+async def register():
     """
     Public registration for new users.
     The first time you run the app you should create the 'admin' user here.
     """
     if request.method == "POST":
-        username = request.form.get("username", "").strip()
-        password = request.form.get("password", "").strip()
-        confirm = request.form.get("confirm_password", "").strip()
+        form = await request.form
+        username = form.get("username", "").strip()
+        password = form.get("password", "").strip()
+        confirm = form.get("confirm_password", "").strip()
 
         if not username or not password or not confirm:
-            flash("Please fill in all fields.", "warning")
+            await flash("Please fill in all fields.", "warning")
             return redirect(url_for("register"))
 
         if password != confirm:
-            flash("Passwords do not match.", "warning")
+            await flash("Passwords do not match.", "warning")
             return redirect(url_for("register"))
 
         if len(username) < 3:
-            flash("Username must be at least 3 characters.", "warning")
+            await flash("Username must be at least 3 characters.", "warning")
             return redirect(url_for("register"))
 
-        conn = get_db()
-        existing = conn.execute(
-            "SELECT id FROM users WHERE username = ?",
-            (username,),
-        ).fetchone()
+        # Hashing is CPU-bound; run it off the event loop before borrowing
+        # a connection so the pool isn't held hostage for the duration.
+        password_hash = await asyncio.to_thread(hash_password, password)
 
-        if existing:
-            conn.close()
-            flash("Username is already taken. Please choose another.", "warning")
-            return redirect(url_for("register"))
+        async with get_db() as conn:
+            existing = conn.execute(
+                "SELECT id FROM users WHERE username = ?",
+                (username,),
+            ).fetchone()
 
-        password_hash = generate_password_hash(password)
-        conn.execute(
-            "INSERT INTO users (username, password_hash) VALUES (?, ?)",
-            (username, password_hash),
-        )
-        conn.commit()
-        conn.close()
+            if existing:
+                await flash("Username is already taken. Please choose another.", "warning")
+                return redirect(url_for("register"))
+
+            await execute_with_retry(
+                conn,
+                "INSERT INTO users (username, password_hash) VALUES (?, ?)",
+                (username, password_hash),
+            )
+            conn.commit()
 
-        flash("Account created successfully. Please log in.", "success")
+        await flash("Account created successfully. Please log in.", "success")
         return redirect(url_for("login"))
 
-    return render_template("register.html")
+    return _cached_page("register.html") or await render_template("register.html")
 
 
 @app.route("/login", methods=["GET", "POST"])
-def login():
+async def login():
     """
     Log a user in using username/password from the SQLite DB.
     Suspended users cannot log in.
     """
     if request.method == "POST":
-        username = request.form.get("username", "").strip()
-        password = request.form.get("password", "").strip()
+        form = await request.form
+        username = form.get("username", "").strip()
+        password = form.get("password", "").strip()
 
-        conn = get_db()
-        user = conn.execute(
-            "SELECT * FROM users WHERE username = ?",
-            (username,),
-        ).fetchone()
-        conn.close()
+        async with get_db() as conn:
+            user = conn.execute(LOGIN_USER_SQL, (username,)).fetchone()
 
         if not user:
-            flash("Invalid username or password.", "danger")
+            await flash("Invalid username or password.", "danger")
             return redirect(url_for("login"))
 
         if user["is_suspended"]:
-            flash("This account is suspended. Please contact the administrator.", "danger")
+            await flash("This account is suspended. Please contact the administrator.", "danger")
             return redirect(url_for("login"))
 
-        if check_password_hash(user["password_hash"], password):
+        # Hash verification is CPU-bound; keep it off the event loop.
+        ok, needs_rehash = await asyncio.to_thread(
+            verify_password, user["password_hash"], password
+        )
+        if ok:
+            if needs_rehash:
+                # Migrate legacy/outdated hashes on successful login.
+                new_hash = await asyncio.to_thread(hash_password, password)
+                async with get_db() as conn:
+                    await execute_with_retry(
+                        conn,
+                        "UPDATE users SET password_hash = ? WHERE id = ?",
+                        (new_hash, user["id"]),
+                    )
+                    conn.commit()
             session["user_id"] = user["id"]
             session["username"] = user["username"]
-            flash("Logged in successfully.", "success")
+            await flash("Logged in successfully.", "success")
             return redirect(url_for("index"))
         else:
-            flash("Invalid username or password.", "danger")
+            await flash("Invalid username or password.", "danger")
 
-    return render_template("login.html")
+    return _cached_page("login.html") or await render_template("login.html")
 
 
 @app.route("/logout")
 @login_required
-def logout():
+async def logout():
     """
     Log out current user and clear session.
     """
     session.clear()
-    flash("You have been logged out.", "info")
+    await flash("You have been logged out.", "info")
     return redirect(url_for("login"))
 
 
@@ -234,156 +601,164 @@ def logout():
 # ---------------------------------------------------------------------
 @app.route("/admin/users")
 @admin_required
-def manage_users():
+async def manage_users():
     """
     Admin panel: list all users.
     """
-    conn = get_db()
-    users = conn.execute(
-        "SELECT id, username, is_suspended FROM users ORDER BY username"
-    ).fetchall()
-    conn.close()
-    return render_template("admin_users.html", users=users)
+    async with get_db() as conn:
+        users = conn.execute(
+            "SELECT id, username, is_suspended FROM users ORDER BY username"
+        ).fetchall()
+    return await render_template("admin_users.html", users=users)
 
 
 @app.route("/admin/users/<int:user_id>/edit", methods=["GET", "POST"])
 @admin_required
-def edit_user(user_id):
+async def edit_user(user_id):
     """
     Edit another user's username and/or reset password.
     Admin cannot change their own username to avoid locking themselves out.
     """
-    conn = get_db()
-    user = conn.execute(
-        "SELECT id, username, is_suspended FROM users WHERE id = ?",
-        (user_id,),
-    ).fetchone()
-
-    if not user:
-        conn.close()
-        flash("User not found.", "warning")
-        return redirect(url_for("manage_users"))
-
     if request.method == "POST":
-        new_username = request.form.get("username", "").strip()
-        new_password = request.form.get("password", "").strip()
-        confirm = request.form.get("confirm_password", "").strip()
+        form = await request.form
+        new_username = form.get("username", "").strip()
+        new_password = form.get("password", "").strip()
+        confirm = form.get("confirm_password", "").strip()
 
         if not new_username:
-            flash("Username cannot be empty.", "warning")
+            await flash("Username cannot be empty.", "warning")
             return redirect(url_for("edit_user", user_id=user_id))
 
-        # Prevent changing username of admin to something else
-        if user["username"] == "admin" and new_username != "admin":
-            flash("You cannot change the username of the admin account.", "warning")
-            return redirect(url_for("edit_user", user_id=user_id))
+        # Optional password reset: validate and hash before borrowing a
+        # connection so the slow argon2 call doesn't hold up the pool.
+        new_hash = None
+        if new_password or confirm:
+            if new_password != confirm:
+                await flash("New password and confirmation do not match.", "warning")
+                return redirect(url_for("edit_user", user_id=user_id))
+            new_hash = await asyncio.to_thread(hash_password, new_password)
 
-        # Check for username conflict with others
-        existing = conn.execute(
-            "SELECT id FROM users WHERE username = ? AND id != ?",
-            (new_username, user_id),
-        ).fetchone()
-        if existing:
-            flash("That username is already in use by another account.", "warning")
-            return redirect(url_for("edit_user", user_id=user_id))
+        async with get_db() as conn:
+            user = conn.execute(
+                "SELECT id, username, is_suspended FROM users WHERE id = ?",
+                (user_id,),
+            ).fetchone()
 
-        # Update username
-        conn.execute(
-            "UPDATE users SET username = ? WHERE id = ?",
-            (new_username, user_id),
-        )
+            if not user:
+                await flash("User not found.", "warning")
+                return redirect(url_for("manage_users"))
 
-        # Optional password reset
-        if new_password or confirm:
-            if new_password != confirm:
-                flash("New password and confirmation do not match.", "warning")
-                conn.commit()
-                conn.close()
+            # Prevent changing username of admin to something else
+            if user["username"] == "admin" and new_username != "admin":
+                await flash("You cannot change the username of the admin account.", "warning")
+                return redirect(url_for("edit_user", user_id=user_id))
+
+            # Check for username conflict with others
+            existing = conn.execute(
+                "SELECT id FROM users WHERE username = ? AND id != ?",
+                (new_username, user_id),
+            ).fetchone()
+            if existing:
+                await flash("That username is already in use by another account.", "warning")
                 return redirect(url_for("edit_user", user_id=user_id))
 
-            new_hash = generate_password_hash(new_password)
-            conn.execute(
-                "UPDATE users SET password_hash = ? WHERE id = ?",
-                (new_hash, user_id),
+            await execute_with_retry(
+                conn,
+                "UPDATE users SET username = ? WHERE id = ?",
+                (new_username, user_id),
             )
 
-        conn.commit()
-        conn.close()
+            if new_hash is not None:
+                await execute_with_retry(
+                    conn,
+                    "UPDATE users SET password_hash = ? WHERE id = ?",
+                    (new_hash, user_id),
+                )
+
+            conn.commit()
+
+        invalidate_user_cache(user_id)
 
-        flash("User details updated.", "success")
+        await flash("User details updated.", "success")
         return redirect(url_for("manage_users"))
 
-    conn.close()
-    return render_template("admin_edit_user.html", user=user)
+    async with get_db() as conn:
+        user = conn.execute(
+            "SELECT id, username, is_suspended FROM users WHERE id = ?",
+            (user_id,),
+        ).fetchone()
+
+    if not user:
+        await flash("User not found.", "warning")
+        return redirect(url_for("manage_users"))
+
+    return await render_template("admin_edit_user.html", user=user)
 
 
 @app.post("/admin/users/<int:user_id>/toggle-suspend")
 @admin_required
-def toggle_suspend_user(user_id):
+async def toggle_suspend_user(user_id):
     """
     Toggle suspension status for a user.
     """
-    conn = get_db()
-    user = conn.execute(
-        "SELECT id, username, is_suspended FROM users WHERE id = ?",
-        (user_id,),
-    ).fetchone()
-
-    if not user:
-        conn.close()
-        flash("User not found.", "warning")
-        return redirect(url_for("manage_users"))
-
-    # Optional: prevent suspending yourself (admin)
-    if user_id == session.get("user_id"):
-        conn.close()
-        flash("You cannot suspend your own account while logged in.", "warning")
-        return redirect(url_for("manage_users"))
+    async with get_db() as conn:
+        user = conn.execute(
+            "SELECT id, username, is_suspended FROM users WHERE id = ?",
+            (user_id,),
+        ).fetchone()
 
-    new_status = 0 if user["is_suspended"] else 1
-    conn.execute(
-        "UPDATE users SET is_suspended = ? WHERE id = ?",
-        (new_status, user_id),
-    )
-    conn.commit()
-    conn.close()
+        if not user:
+            await flash("User not found.", "warning")
+            return redirect(url_for("manage_users"))
+
+        # Optional: prevent suspending yourself (admin)
+        if user_id == g.user_id:
+            await flash("You cannot suspend your own account while logged in.", "warning")
+            return redirect(url_for("manage_users"))
+
+        new_status = 0 if user["is_suspended"] else 1
+        await execute_with_retry(
+            conn,
+            "UPDATE users SET is_suspended = ? WHERE id = ?",
+            (new_status, user_id),
+        )
+        conn.commit()
+        invalidate_user_cache(user_id)
 
     if new_status:
-        flash(f"User '{user['username']}' has been suspended.", "info")
+        await flash(f"User '{user['username']}' has been suspended.", "info")
     else:
-        flash(f"User '{user['username']}' has been reactivated.", "success")
+        await flash(f"User '{user['username']}' has been reactivated.", "success")
 
     return redirect(url_for("manage_users"))
 
 
 @app.post("/admin/users/<int:user_id>/delete")
 @admin_required
-def delete_user(user_id):
+async def delete_user(user_id):
     """
     Delete a user account. Cannot delete currently logged-in admin.
     """
-    current_id = session.get("user_id")
-    conn = get_db()
-    user = conn.execute(
-        "SELECT id, username FROM users WHERE id = ?",
-        (user_id,),
-    ).fetchone()
+    current_id = g.user_id
+    async with get_db() as conn:
+        user = conn.execute(
+            "SELECT id, username FROM users WHERE id = ?",
+            (user_id,),
+        ).fetchone()
 
-    if not user:
-        conn.close()
-        flash("User not found.", "warning")
-        return redirect(url_for("manage_users"))
+        if not user:
+            await flash("User not found.", "warning")
+            return redirect(url_for("manage_users"))
 
-    if user_id == current_id:
-        conn.close()
-        flash("You cannot delete the account you are logged in with.", "warning")
-        return redirect(url_for("manage_users"))
+        if user_id == current_id:
+            await flash("You cannot delete the account you are logged in with.", "warning")
+            return redirect(url_for("manage_users"))
 
-    conn.execute("DELETE FROM users WHERE id = ?", (user_id,))
-    conn.commit()
-    conn.close()
+        await execute_with_retry(conn, "DELETE FROM users WHERE id = ?", (user_id,))
+        conn.commit()
+        invalidate_user_cache(user_id)
 
-    flash(f"User '{user['username']}' has been deleted.", "success")
+    await flash(f"User '{user['username']}' has been deleted.", "success")
     return redirect(url_for("manage_users"))
 
 
@@ -392,68 +767,68 @@ def delete_user(user_id):
 # ---------------------------------------------------------------------
 @app.route("/cases")
 @login_required
-def list_cases():
+async def list_cases():
     """
     List cases.
     - Admin sees all cases.
     - Normal users see only the cases they created.
     """
-    conn = get_db()
-    if is_admin():
-        cases = conn.execute(
-            """
-            SELECT c.*, u.username AS creator_name
-            FROM cases c
-            JOIN users u ON c.created_by = u.id
-            ORDER BY datetime(c.created_at) DESC
-            """
-        ).fetchall()
-    else:
-        cases = conn.execute(
-            """
-            SELECT c.*, u.username AS creator_name
-            FROM cases c
-            JOIN users u ON c.created_by = u.id
-            WHERE c.created_by = ?
-            ORDER BY datetime(c.created_at) DESC
-            """,
-            (session.get("user_id"),),
-        ).fetchall()
-    conn.close()
-    return render_template("cases_list.html", cases=cases)
+    async with get_db() as conn:
+        if is_admin():
+            cases = conn.execute(
+                """
+                SELECT c.*, u.username AS creator_name
+                FROM cases c
+                JOIN users u ON c.created_by = u.id
+                ORDER BY datetime(c.created_at) DESC
+                """
+            ).fetchall()
+        else:
+            cases = conn.execute(
+                """
+                SELECT c.*, u.username AS creator_name
+                FROM cases c
+                JOIN users u ON c.created_by = u.id
+                WHERE c.created_by = ?
+                ORDER BY datetime(c.created_at) DESC
+                """,
+                (g.user_id,),
+            ).fetchall()
+    return await render_template("cases_list.html", cases=cases)
 
 
 @app.route("/cases/new", methods=["GET", "POST"])
 @login_required
-def create_case():
+async def create_case():
     """
     Create a new case.
     """
     if request.method == "POST":
-        title = request.form.get("title", "").strip()
-        description = request.form.get("description", "").strip()
-        status = request.form.get("status", "Open").strip() or "Open"
+        form = await request.form
+        title = form.get("title", "").strip()
+        description = form.get("description", "").strip()
+        status = form.get("status", "Open").strip() or "Open"
 
         if not title:
-            flash("Case title is required.", "warning")
+            await flash("Case title is required.", "warning")
             return redirect(url_for("create_case"))
 
         now = datetime.utcnow().isoformat(timespec="seconds")
-        conn = get_db()
-        conn.execute(
-            """
-            INSERT INTO cases (title, description, status, created_by, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (title, description, status, session.get("user_id"), now, now),
-        )
-        conn.commit()
-        conn.close()
+        async with get_db() as conn:
+            await execute_with_retry(
+                conn,
+                """
+                INSERT INTO cases (title, description, status, created_by, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (title, description, status, g.user_id, now, now),
+            )
+            conn.commit()
 
-        flash("Case created successfully.", "success")
+        await flash("Case created successfully.", "success")
         return redirect(url_for("list_cases"))
 
-    return render_template("case_form.html", mode="create", case=None)
+    return await render_template("case_form.html", mode="create", case=None)
 
 
 def user_can_access_case(case_row):
@@ -464,119 +839,113 @@ def user_can_access_case(case_row):
     """
     if is_admin():
         return True
-    return case_row["created_by"] == session.get("user_id")
+    return case_row["created_by"] == g.user_id
 
 
 @app.route("/cases/<int:case_id>")
 @login_required
-def case_detail(case_id):
+async def case_detail(case_id):
     """
     View details of a case.
     """
-    conn = get_db()
-    case = conn.execute(
-        """
-        SELECT c.*, u.username AS creator_name
-        FROM cases c
-        JOIN users u ON c.created_by = u.id
-        WHERE c.id = ?
-        """,
-        (case_id,),
-    ).fetchone()
-    conn.close()
+    async with get_db() as conn:
+        case = conn.execute(
+            """
+            SELECT c.*, u.username AS creator_name
+            FROM cases c
+            JOIN users u ON c.created_by = u.id
+            WHERE c.id = ?
+            """,
+            (case_id,),
+        ).fetchone()
 
     if not case:
-        flash("Case not found.", "warning")
+        await flash("Case not found.", "warning")
         return redirect(url_for("list_cases"))
 
     if not user_can_access_case(case):
-        flash("You are not allowed to view this case.", "danger")
+        await flash("You are not allowed to view this case.", "danger")
         return redirect(url_for("list_cases"))
 
-    return render_template("case_detail.html", case=case)
+    return await render_template("case_detail.html", case=case)
 
 
 @app.route("/cases/<int:case_id>/edit", methods=["GET", "POST"])
 @login_required
-def edit_case(case_id):
+async def edit_case(case_id):
     """
     Edit an existing case.
     Admin can edit any case.
     Normal users can only edit their own cases.
     """
-    conn = get_db()
-    case = conn.execute(
-        "SELECT * FROM cases WHERE id = ?",
-        (case_id,),
-    ).fetchone()
-
-    if not case:
-        conn.close()
-        flash("Case not found.", "warning")
-        return redirect(url_for("list_cases"))
-
-    if not user_can_access_case(case):
-        conn.close()
-        flash("You are not allowed to edit this case.", "danger")
-        return redirect(url_for("list_cases"))
-
-    if request.method == "POST":
-        title = request.form.get("title", "").strip()
-        description = request.form.get("description", "").strip()
-        status = request.form.get("status", "").strip()
-
-        if not title:
-            flash("Case title is required.", "warning")
-            return redirect(url_for("edit_case", case_id=case_id))
+    async with get_db() as conn:
+        case = conn.execute(
+            "SELECT * FROM cases WHERE id = ?",
+            (case_id,),
+        ).fetchone()
 
-        now = datetime.utcnow().isoformat(timespec="seconds")
-        conn.execute(
-            """
-            UPDATE cases
-            SET title = ?, description = ?, status = ?, updated_at = ?
-            WHERE id = ?
-            """,
-            (title, description, status or "Open", now, case_id),
-        )
-        conn.commit()
-        conn.close()
+        if not case:
+            await flash("Case not found.", "warning")
+            return redirect(url_for("list_cases"))
+
+        if not user_can_access_case(case):
+            await flash("You are not allowed to edit this case.", "danger")
+            return redirect(url_for("list_cases"))
+
+        if request.method == "POST":
+            form = await request.form
+            title = form.get("title", "").strip()
+            description = form.get("description", "").strip()
+            status = form.get("status", "").strip()
+
+            if not title:
+                await flash("Case title is required.", "warning")
+                return redirect(url_for("edit_case", case_id=case_id))
+
+            now = datetime.utcnow().isoformat(timespec="seconds")
+            await execute_with_retry(
+                conn,
+                """
+                UPDATE cases
+                SET title = ?, description = ?, status = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                (title, description, status or "Open", now, case_id),
+            )
+            conn.commit()
 
-        flash("Case updated successfully.", "success")
-        return redirect(url_for("case_detail", case_id=case_id))
+            await flash("Case updated successfully.", "success")
+            return redirect(url_for("case_detail", case_id=case_id))
 
-    conn.close()
-    return render_template("case_form.html", mode="edit", case=case)
+    return await render_template("case_form.html", mode="edit", case=case)
 
 
 @app.post("/cases/<int:case_id>/delete")
 @login_required
-def delete_case(case_id):
+async def delete_case(case_id):
     """
     Delete a case.
     Admin can delete any case.
     Normal user can only delete their own case.
     """
-    conn = get_db()
-    case = conn.execute(
-        "SELECT * FROM cases WHERE id = ?",
-        (case_id,),
-    ).fetchone()
+    async with get_db() as conn:
+        case = conn.execute(
+            "SELECT * FROM cases WHERE id = ?",
+            (case_id,),
+        ).fetchone()
 
-    if not case:
-        conn.close()
-        flash("Case not found.", "warning")
-        return redirect(url_for("list_cases"))
+        if not case:
+            await flash("Case not found.", "warning")
+            return redirect(url_for("list_cases"))
 
-    if not user_can_access_case(case):
-        conn.close()
-        flash("You are not allowed to delete this case.", "danger")
-        return redirect(url_for("list_cases"))
+        if not user_can_access_case(case):
+            await flash("You are not allowed to delete this case.", "danger")
+            return redirect(url_for("list_cases"))
 
-    conn.execute("DELETE FROM cases WHERE id = ?", (case_id,))
-    conn.commit()
-    conn.close()
+        await execute_with_retry(conn, "DELETE FROM cases WHERE id = ?", (case_id,))
+        conn.commit()
 
-    flash("Case deleted.", "info")
+    await flash("Case deleted.", "info")
     return redirect(url_for("list_cases"))
 
 
@@ -585,85 +954,262 @@ def delete_case(case_id):
 # ---------------------------------------------------------------------
 @app.route("/")
 @login_required
-def index():
+async def index():
     """
     Main dashboard.
     """
-    return render_template("index.html")
+    return await render_template("index.html")
 
 
 @app.route("/search-image", methods=["POST"])
 @login_required
-def search_image():
+async def search_image():
     """
     Handles sketch/photo upload.
     For now: returns DUMMY results.
     """
-    file = request.files.get("query_image")
+    files = await request.files
+    file = files.get("query_image")
 
     if not file or file.filename == "":
-        flash("Please choose a sketch or photo to upload.", "warning")
+        await flash("Please choose a sketch or photo to upload.", "warning")
         return redirect(url_for("index"))
 
-    if not allowed_file(file.filename, ALLOWED_IMAGE_EXTENSIONS):
-        flash("Unsupported image type. Please upload a JPG or PNG.", "warning")
+    if not allowed_file(file.filename, IMAGE_NAME_RE):
+        await flash("Unsupported image type. Please upload a JPG or PNG.", "warning")
         return redirect(url_for("index"))
 
-    filename = secure_filename(file.filename)
+    filename = build_upload_name(file.filename)
     save_path = os.path.join(IMAGE_UPLOAD_DIR, filename)
-    file.save(save_path)
+    await asyncio.to_thread(_save_upload, file, save_path)
 
-    dummy_results = [
-        {"label": "Person_A", "score": 0.23, "source": "suspect_ali_1.jpg"},
-        {"label": "Person_B", "score": 0.41, "source": "suspect_maria_2.png"},
-        {"label": "Unknown", "score": 0.68, "source": "unknown_3.png"},
-    ]
+    # Map the saved image read-only and hand the buffer to the
+    # recognition pass zero-copy.
+    with mmap_readonly(save_path) as query_buffer:
+        results = run_recognition(query_buffer)
 
     query_image_url = url_for("static", filename=f"uploads/images/{filename}")
 
-    return render_template(
+    return await render_template(
         "image_results.html",
         query_image=query_image_url,
-        results=dummy_results,
+        results=results,
     )
 
 
 @app.route("/search-video", methods=["POST"])
 @login_required
-def search_video():
+async def search_video():
     """
     Handles CCTV/video upload.
     For now: returns DUMMY match timeline.
     """
-    file = request.files.get("video_file")
+    files = await request.files
+    file = files.get("video_file")
 
     if not file or file.filename == "":
-        flash("Please choose a CCTV/video file to upload.", "warning")
+        await flash("Please choose a CCTV/video file to upload.", "warning")
         return redirect(url_for("index"))
 
-    if not allowed_file(file.filename, ALLOWED_VIDEO_EXTENSIONS):
-        flash("Unsupported video type. Please upload MP4 / AVI / MOV / MKV.", "warning")
+    if not allowed_file(file.filename, VIDEO_NAME_RE):
+        await flash("Unsupported video type. Please upload MP4 / AVI / MOV / MKV.", "warning")
         return redirect(url_for("index"))
 
-    filename = secure_filename(file.filename)
+    filename = build_upload_name(file.filename)
     save_path = os.path.join(VIDEO_UPLOAD_DIR, filename)
-    file.save(save_path)
+    await asyncio.to_thread(_save_upload, file, save_path)
 
-    dummy_matches = [
-        {"time": "00:05", "label": "Person_A", "score": 0.27},
-        {"time": "00:23", "label": "Person_B", "score": 0.35},
-        {"time": "01:02", "label": "Unknown", "score": 0.62},
-    ]
+    return await render_template(
+        "video_results.html",
+        video_name=file.filename,
+        matches=DUMMY_VIDEO_MATCHES,
+    )
+
+
+@app.route("/search-video-stream", methods=["POST"])
+@login_required
+async def search_video_stream():
+    """
+    Streaming CCTV/video upload: raw bytes with the filename in an
+    X-Filename header. Chunks go straight to disk as they arrive, so
+    memory stays flat regardless of the video size (the multipart route
+    buffers the whole body before the handler runs).
+    """
+    filename = request.headers.get("X-Filename", "")
+
+    if not filename:
+        return {"error": "Missing X-Filename header."}, 400
 
-    return render_template(
+    if not allowed_file(filename, VIDEO_NAME_RE):
+        return {"error": "Unsupported video type. Please upload MP4 / AVI / MOV / MKV."}, 400
+
+    stored_name = build_upload_name(filename)
+    save_path = os.path.join(VIDEO_UPLOAD_DIR, stored_name)
+
+    size = int(request.headers.get("Content-Length", 0) or 0)
+    fd = await asyncio.to_thread(_open_preallocated, save_path, size)
+    try:
+        async for chunk in request.body:
+            # write(2) in a thread so disk I/O doesn't stall the loop
+            await asyncio.to_thread(os.write, fd, chunk)
+    except Exception:
+        os.unlink(save_path)
+        raise
+    finally:
+        os.close(fd)
+
+    return {
+        "video_name": stored_name,
+        "redirect": url_for("video_results", video_name=stored_name, display=filename),
+    }
+
+
+def _merge_ranges(ranges):
+    """
+    Collapse a list of (start, end) byte ranges into sorted,
+    non-overlapping runs.
+    """
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _sweep_stale_uploads():
+    """
+    Drop chunked uploads that haven't seen a chunk within
+    CHUNK_UPLOAD_TTL and unlink their preallocated partial files.
+    """
+    cutoff = time.monotonic() - CHUNK_UPLOAD_TTL
+    for upload_id, state in list(_chunk_uploads.items()):
+        if state["touched"] < cutoff:
+            del _chunk_uploads[upload_id]
+            try:
+                os.unlink(os.path.join(VIDEO_UPLOAD_DIR, state["stored_name"]))
+            except FileNotFoundError:
+                pass
+
+
+@app.route("/upload-chunk", methods=["POST"])
+@login_required
+async def upload_chunk():
+    """
+    Resumable chunked upload for CCTV videos.
+
+    Clients slice the file (e.g. 8 MB pieces), POST each with a
+    Content-Range header, and retry only the chunks that fail. The first
+    chunk (no X-Upload-Id header) names the file and mints an upload id;
+    every 308 echoes it back in X-Upload-Id and later chunks must resend
+    it. Responds 308 with a Range header of the contiguous bytes received
+    so far, and 200 once the whole file is on disk.
+    """
+    match = CONTENT_RANGE_RE.fullmatch(request.headers.get("Content-Range", ""))
+    if not match:
+        return {"error": "Missing or malformed Content-Range header."}, 400
+
+    start, end, total = (int(g) for g in match.groups())
+    if end < start or end >= total:
+        return {"error": "Invalid Content-Range values."}, 400
+
+    # Bound memory before buffering the body: without this, a claimed
+    # 8 GB "chunk" would be read into RAM wholesale.
+    if end - start + 1 > MAX_CHUNK_SIZE:
+        return {"error": "Chunk too large."}, 413
+
+    body = await request.get_data()
+    if len(body) != end - start + 1:
+        return {"error": "Chunk size does not match Content-Range."}, 400
+
+    _sweep_stale_uploads()
+
+    upload_id = request.headers.get("X-Upload-Id", "")
+    if upload_id:
+        state = _chunk_uploads.get(upload_id)
+        if state is None or state["total"] != total:
+            return {"error": "Unknown upload id. Restart the upload."}, 410
+        state["touched"] = time.monotonic()
+    else:
+        # First chunk: validate the client's filename, then key the upload
+        # (and the stored path) on a server-issued id so two browsers
+        # pushing same-named files can never write into each other's file.
+        filename = request.headers.get("X-Filename", "")
+        if not filename:
+            return {"error": "Missing X-Filename header."}, 400
+        if not allowed_file(filename, VIDEO_NAME_RE):
+            return {"error": "Unsupported video type. Please upload MP4 / AVI / MOV / MKV."}, 400
+        upload_id = uuid.uuid4().hex
+        state = _chunk_uploads[upload_id] = {
+            "total": total,
+            "ranges": [],
+            "stored_name": f"{upload_id}.{filename.rsplit('.', 1)[1].lower()}",
+            "display": filename,
+            "touched": time.monotonic(),
+        }
+
+    save_path = os.path.join(VIDEO_UPLOAD_DIR, state["stored_name"])
+
+    # Create (and preallocate to the full size) on the first chunk,
+    # then patch bytes in place for every chunk.
+    if not os.path.exists(save_path):
+        fd = await asyncio.to_thread(_open_preallocated, save_path, total)
+        os.close(fd)
+    await asyncio.to_thread(_write_at, save_path, start, body)
+
+    state["ranges"].append((start, end))
+    state["ranges"] = _merge_ranges(state["ranges"])
+
+    if state["ranges"][0] == (0, total - 1):
+        # pop, not del: a retried final chunk may race the one that
+        # already completed the upload.
+        _chunk_uploads.pop(upload_id, None)
+        return {
+            "video_name": state["stored_name"],
+            "redirect": url_for(
+                "video_results",
+                video_name=state["stored_name"],
+                display=state["display"],
+            ),
+        }
+
+    # Report the contiguous prefix so clients know where to resume from;
+    # when nothing contiguous from byte 0 has landed yet there is no
+    # valid range to report, so the header is omitted entirely.
+    headers = {"X-Upload-Id": upload_id}
+    first_start, first_end = state["ranges"][0]
+    if first_start == 0:
+        headers["Range"] = f"bytes=0-{first_end}"
+    return Response("", status=308, headers=headers)
+
+
+@app.route("/video-results/<video_name>")
+@login_required
+async def video_results(video_name):
+    """
+    Results page for a streamed video upload. Shows the original
+    filename (?display=...) when the upload was stored under a
+    generated name. For now: returns the DUMMY match timeline.
+    """
+    return await render_template(
         "video_results.html",
-        video_name=filename,
-        matches=dummy_matches,
+        video_name=request.args.get("display", video_name),
+        matches=DUMMY_VIDEO_MATCHES,
     )
 
 
 # ---------------------------------------------------------------------
 # Entry point
 # ---------------------------------------------------------------------
-if __name__ == "__main__":
+# Production: gunicorn -c gunicorn.conf.py app:app
+# The debug dev server is opt-in via SKETCHY_DEV so a stray
+# `python app.py` on a box never serves traffic with the reloader and
+# debugger enabled.
+if __name__ == "__main__" and os.environ.get("SKETCHY_DEV"):
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass  # optional; plain asyncio works, just slower for big uploads
     app.run(host="0.0.0.0", port=5000, debug=True)
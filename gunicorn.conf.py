@@ -0,0 +1,21 @@
+import os
+
+# Production entry point:
+#     gunicorn -c gunicorn.conf.py app:app
+#
+# Quart is ASGI, so requests go through uvicorn's worker class (which
+# picks up uvloop when installed) rather than sync/gthread workers.
+#
+# Chunked-upload progress (_chunk_uploads) and the user cache live
+# per-process, so with several workers a second chunk can land on a
+# worker that never saw the first and the upload 410s. Default to one
+# worker; raise WEB_CONCURRENCY only after that state moves to a shared
+# store (or /upload-chunk gets sticky routing in nginx).
+bind = "0.0.0.0:5000"
+workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Multi-GB CCTV uploads can legitimately take minutes.
+timeout = 600
+graceful_timeout = 30
+keepalive = 5